@@ -4,75 +4,212 @@ Simple client for the Hetzner Cloud MCP server.
 """
 
 import asyncio
-import dotenv
+import contextlib
+import functools
+import hashlib
+import json
 import os
 import sys
+from itertools import islice
+from pathlib import Path
 
-from mcp.client import Client as MCPClient
+# Load environment variables, skipping the .env file if the token is already set
+_env = os.environ
+if "HCLOUD_TOKEN" not in _env:
+    import dotenv
 
-# Load environment variables
-dotenv.load_dotenv()
+    dotenv.load_dotenv()
 
 # Check if Hetzner Cloud API token is configured
-if "HCLOUD_TOKEN" not in os.environ:
+_token = _env.get("HCLOUD_TOKEN")
+if not _token:
     print(
         "Error: HCLOUD_TOKEN environment variable not set. Please add it to your .env file."
     )
     sys.exit(1)
 
+# MCP server address, resolved once at import
+MCP_HOST = _env.get("MCP_HOST", "localhost")
+MCP_PORT = int(_env.get("MCP_PORT", 8080))
+MCP_URL = f"http://{MCP_HOST}:{MCP_PORT}"
 
-async def run_test_client():
-    """Run a test client to verify MCP server functionality."""
-    # Connect to the MCP server
-    host = os.environ.get("MCP_HOST", "localhost")
-    port = int(os.environ.get("MCP_PORT", 8080))
-    print(f"Connecting to MCP server at {host}:{port}...")
+# Catalog listings (server types, images, locations) rarely change
+CATALOG_TTL = 3600
+CACHE_DIR = Path.home() / ".cache" / "mcp-hetzner"
+
+# Cached responses are scoped to the server and project they came from
+# (list_images includes the project's own snapshots and backups)
+_CACHE_SCOPE = f"{MCP_URL}|{hashlib.sha256(_token.encode()).hexdigest()[:16]}"
+
+# The optional speedups (uvloop, diskcache, orjson) and httpx are imported
+# on first use, so importing this module stays cheap
+
+
+@functools.cache
+def retryable_errors():
+    """
+    Return the errors that are worth retrying before giving up on a call.
+
+    The MCP client talks over httpx, whose connect/read failures are not
+    ConnectionErrors. By the time a call is made httpx is already loaded.
+    """
+    errors = (ConnectionError, asyncio.TimeoutError)
+    try:
+        import httpx
+    except ImportError:
+        return errors
+    return errors + (httpx.TransportError,)
 
-    client = MCPClient(f"http://{host}:{port}")
 
+def event_loop_factory():
+    """Return uvloop's event loop factory when it is installed, else None."""
     try:
-        # Test list_server_types
-        print("\nTesting list_server_types...")
-        response = await client.invoke("list_server_types")
-        print(f"Available server types: {len(response['server_types'])}")
-        for st in response["server_types"][:3]:  # Print first 3 as example
-            print(
-                f"- {st['name']}: {st['cores']} cores, {st['memory_gb']} GB RAM, {st['disk_gb']} GB disk"
-            )
-
-        # Test list_images
-        print("\nTesting list_images...")
-        response = await client.invoke("list_images")
-        print(f"Available images: {len(response['images'])}")
-        for img in response["images"][:3]:  # Print first 3 as example
-            print(
-                f"- {img['name'] or img['id']}: {img['description'] or 'No description'}"
-            )
-
-        # Test list_locations
-        print("\nTesting list_locations...")
-        response = await client.invoke("list_locations")
-        print(f"Available locations: {len(response['locations'])}")
-        for loc in response["locations"]:
-            print(
-                f"- {loc['name']}: {loc['description']} ({loc['city']}, {loc['country']})"
-            )
-
-        # Test list_servers
-        print("\nTesting list_servers...")
-        response = await client.invoke("list_servers")
-        print(f"Current servers: {len(response['servers'])}")
-        for server in response["servers"]:
-            print(f"- {server['name']} (ID: {server['id']}): {server['status']}")
-
-        print("\nAll tests completed successfully!")
-    except Exception as e:
-        print(f"Error during test: {e}")
+        import uvloop
+    except ImportError:  # uvloop is optional
+        return None
+    return uvloop.new_event_loop
+
+
+def open_cache():
+    """
+    Open the on-disk response cache for use in a with block.
+
+    The with block yields None if diskcache is not installed.
+    """
+    try:
+        import diskcache
+    except ImportError:  # diskcache is optional
+        return contextlib.nullcontext()
+    return diskcache.Cache(str(CACHE_DIR))
+
+
+@functools.cache
+def _orjson():
+    """Return the orjson module, or None to fall back to the stdlib json module."""
+    try:
+        import orjson
+    except ImportError:  # orjson is optional
+        return None
+    return orjson
+
+
+def _dumps(value):
+    """Serialize a response for the cache, using orjson when available."""
+    orjson = _orjson()
+    return orjson.dumps(value) if orjson else json.dumps(value).encode()
+
+
+def _loads(raw):
+    """Deserialize a cached response, using orjson when available."""
+    orjson = _orjson()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_lines(lines):
+    """Write all lines to stdout with a single write call."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+async def invoke_with_retry(client, name, args=None, retries=3, backoff=0.3):
+    """Invoke an MCP tool, retrying transient failures with exponential backoff."""
+    for attempt in range(retries):
+        try:
+            return await client.invoke(name, args)
+        except retryable_errors():
+            if attempt == retries - 1:
+                raise
+            await asyncio.sleep(backoff * 2**attempt)
+
+
+async def cached_invoke(client, cache, name, args=None, ttl=0):
+    """
+    Invoke an MCP tool, serving the response from the on-disk cache when possible.
+
+    A ttl of 0 bypasses the cache entirely, which should be used for
+    resources that change frequently (e.g. servers and volumes).
+    Error responses are never cached.
+    """
+    if cache is None or not ttl:
+        return await invoke_with_retry(client, name, args)
+
+    key = hashlib.sha1(f"{_CACHE_SCOPE}|{name}|{args!r}".encode()).hexdigest()
+    raw = cache.get(key)
+    if raw is not None:
+        return _loads(raw)
+
+    result = await invoke_with_retry(client, name, args)
+    if not (isinstance(result, dict) and "error" in result):
+        cache.set(key, _dumps(result), expire=ttl)
+    return result
+
+
+async def run_test_client():
+    """Run a test client to verify MCP server functionality."""
+    # Imported here so importing this module stays cheap
+    from mcp.client import Client as MCPClient
+
+    # Connect to the MCP server
+    print(f"Connecting to MCP server at {MCP_HOST}:{MCP_PORT}...")
+
+    # Reuse one client (and its pooled connection) for every invocation
+    with open_cache() as cache:
+        async with MCPClient(MCP_URL) as client:
+            try:
+                # The list calls are independent, so issue them concurrently
+                st_resp, img_resp, loc_resp, srv_resp = await asyncio.gather(
+                    cached_invoke(client, cache, "list_server_types", ttl=CATALOG_TTL),
+                    cached_invoke(client, cache, "list_images", ttl=CATALOG_TTL),
+                    cached_invoke(client, cache, "list_locations", ttl=CATALOG_TTL),
+                    invoke_with_retry(client, "list_servers"),
+                )
+
+                # Test list_server_types
+                print("\nTesting list_server_types...")
+                print(f"Available server types: {len(st_resp['server_types'])}")
+                write_lines(  # Print first 3 as example
+                    f"- {st['name']}: {st['cores']} cores, {st['memory_gb']} GB RAM, {st['disk_gb']} GB disk"
+                    for st in islice(st_resp["server_types"], 3)
+                )
+
+                # Test list_images
+                print("\nTesting list_images...")
+                print(f"Available images: {len(img_resp['images'])}")
+                write_lines(  # Print first 3 as example
+                    f"- {img['name'] or img['id']}: {img['description'] or 'No description'}"
+                    for img in islice(img_resp["images"], 3)
+                )
+
+                # Test list_locations
+                print("\nTesting list_locations...")
+                print(f"Available locations: {len(loc_resp['locations'])}")
+                write_lines(
+                    f"- {loc['name']}: {loc['description']} ({loc['city']}, {loc['country']})"
+                    for loc in loc_resp["locations"]
+                )
+
+                # Test list_servers
+                print("\nTesting list_servers...")
+                print(f"Current servers: {len(srv_resp['servers'])}")
+                write_lines(
+                    f"- {server['name']} (ID: {server['id']}): {server['status']}"
+                    for server in srv_resp["servers"]
+                )
+
+                print("\nAll tests completed successfully!")
+            except Exception as e:
+                print(f"Error during test: {e}")
 
 
 def main():
     """Entry point for the client script."""
-    asyncio.run(run_test_client())
+    # Listings are written in one go, so line buffering only adds flushes
+    sys.stdout.reconfigure(line_buffering=False)
+
+    # Use uvloop's event loop when it is installed
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        runner.run(run_test_client())
 
 
 if __name__ == "__main__":
@@ -5,132 +5,155 @@ Hetzner Cloud MCP Example - Examples for using the Hetzner Cloud MCP
 
 import asyncio
 import logging
-import os
 import sys
-
-import dotenv
-from mcp.client import Client
+from itertools import islice
+
+# Importing the client also loads .env and checks that HCLOUD_TOKEN is set
+from mcp_hetzner.client import (
+    CATALOG_TTL,
+    MCP_URL,
+    cached_invoke,
+    event_loop_factory,
+    invoke_with_retry,
+    open_cache,
+    write_lines,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-dotenv.load_dotenv()
-
-# Check if Hetzner Cloud API token is configured
-HCLOUD_TOKEN = os.environ.get("HCLOUD_TOKEN")
-if not HCLOUD_TOKEN:
-    print(
-        "Error: HCLOUD_TOKEN environment variable not set. Please add it to your .env file."
-    )
-    sys.exit(1)
-
 
 async def run_example():
     """Run examples of Hetzner Cloud MCP usage."""
-    # Connect to the MCP server
-    host = os.environ.get("MCP_HOST", "localhost")
-    port = int(os.environ.get("MCP_PORT", 8080))
-    client = Client(f"http://{host}:{port}")
-
-    # Get available server types
-    server_types = await client.invoke("list_server_types")
-    print("Available server types:")
-    for server_type in server_types["server_types"][:3]:  # Show first 3 for brevity
-        print(
+    # Imported here so importing this module stays cheap
+    from mcp.client import Client
+
+    # Connect to the MCP server, reusing one client (and its pooled
+    # connection) for every invocation
+    async with Client(MCP_URL) as client:
+        # Fetch the listings concurrently; they don't depend on each other.
+        # The response cache is only needed (and kept open) for this step.
+        with open_cache() as cache:
+            server_types, locations, servers, volumes = await asyncio.gather(
+                cached_invoke(client, cache, "list_server_types", ttl=CATALOG_TTL),
+                cached_invoke(client, cache, "list_locations", ttl=CATALOG_TTL),
+                invoke_with_retry(client, "list_servers"),
+                invoke_with_retry(client, "list_volumes"),
+            )
+
+        # Get available server types
+        print("Available server types:")
+        write_lines(  # Show first 3 for brevity
             f"- {server_type['name']}: {server_type['cores']} Cores, {server_type['memory_gb']} GB RAM, {server_type['disk_gb']} GB Disk"
+            for server_type in islice(server_types["server_types"], 3)
         )
-    print()
+        print()
 
-    # Get available locations
-    locations = await client.invoke("list_locations")
-    print("Available locations:")
-    for location in locations["locations"]:
-        print(
+        # Get available locations
+        print("Available locations:")
+        write_lines(
             f"- {location['name']}: {location['description']} ({location['country']}, {location['city']})"
+            for location in locations["locations"]
         )
-    print()
+        print()
 
-    # List servers
-    servers = await client.invoke("list_servers")
-    print(f"Current servers: {len(servers['servers'])}")
-    for server in servers["servers"]:
-        print(
+        # List servers
+        print(f"Current servers: {len(servers['servers'])}")
+        write_lines(
             f"- {server['name']} (ID: {server['id']}): {server['status']}, IP: {server['public_net']['ipv4']}"
+            for server in servers["servers"]
         )
-    print()
+        print()
 
-    # List volumes
-    volumes = await client.invoke("list_volumes")
-    print(f"Current volumes: {len(volumes.get('volumes', []))}")
-    for volume in volumes.get("volumes", []):
-        print(
+        # List volumes
+        vols = volumes.get("volumes") or ()
+        print(f"Current volumes: {len(vols)}")
+        write_lines(
             f"- {volume['name']} (ID: {volume['id']}): {volume['size']} GB, Server: {volume['server']}"
+            for volume in vols
         )
-    print()
+        print()
+
+        # Create a volume example (disabled to prevent actual creation)
+        if False:
+            await _demo_volume_workflow(client, servers)
+
 
-    # Create a volume example (commented out to prevent actual creation)
-    """
+async def _demo_volume_workflow(client, servers):
+    """Create a volume, attach/detach it to the first server, then delete it."""
     print("Creating a new volume...")
-    new_volume = await client.invoke("create_volume", {
-        "name": "example-volume",
-        "size": 10,  # 10 GB
-        "location": "nbg1",  # Nuremberg
-        "format": "ext4"
-    })
-    
+    new_volume = await client.invoke(
+        "create_volume",
+        {
+            "name": "example-volume",
+            "size": 10,  # 10 GB
+            "location": "nbg1",  # Nuremberg
+            "format": "ext4",
+        },
+    )
+
     if "error" in new_volume:
         print(f"Error creating volume: {new_volume['error']}")
-    else:
-        print(f"Volume created: {new_volume['volume']['name']} (ID: {new_volume['volume']['id']})")
-        
-        # Attach volume to a server (if you have a server)
-        if servers['servers']:
-            server_id = servers['servers'][0]['id']
-            print(f"Attaching volume to server {server_id}...")
-            
-            attach_result = await client.invoke("attach_volume", {
-                "volume_id": new_volume['volume']['id'],
+        return
+
+    print(
+        f"Volume created: {new_volume['volume']['name']} (ID: {new_volume['volume']['id']})"
+    )
+
+    # Attach volume to a server (if you have a server)
+    if servers["servers"]:
+        server_id = servers["servers"][0]["id"]
+        print(f"Attaching volume to server {server_id}...")
+
+        attach_result = await client.invoke(
+            "attach_volume",
+            {
+                "volume_id": new_volume["volume"]["id"],
                 "server_id": server_id,
-                "automount": True
-            })
-            
-            if "error" in attach_result:
-                print(f"Error attaching volume: {attach_result['error']}")
-            else:
-                print("Volume attached successfully")
-                
-            # Wait for a moment before detaching
-            await asyncio.sleep(10)
-            
-            # Detach the volume
-            print("Detaching volume...")
-            detach_result = await client.invoke("detach_volume", {
-                "volume_id": new_volume['volume']['id']
-            })
-            
-            if "error" in detach_result:
-                print(f"Error detaching volume: {detach_result['error']}")
-            else:
-                print("Volume detached successfully")
-            
-        # Delete the volume
-        print("Deleting volume...")
-        delete_result = await client.invoke("delete_volume", {
-            "volume_id": new_volume['volume']['id']
-        })
-        
-        if "error" in delete_result:
-            print(f"Error deleting volume: {delete_result['error']}")
+                "automount": True,
+            },
+        )
+
+        if "error" in attach_result:
+            print(f"Error attaching volume: {attach_result['error']}")
         else:
-            print("Volume deleted successfully")
-    """
+            print("Volume attached successfully")
+
+        # Wait for a moment before detaching
+        await asyncio.sleep(10)
+
+        # Detach the volume
+        print("Detaching volume...")
+        detach_result = await client.invoke(
+            "detach_volume", {"volume_id": new_volume["volume"]["id"]}
+        )
+
+        if "error" in detach_result:
+            print(f"Error detaching volume: {detach_result['error']}")
+        else:
+            print("Volume detached successfully")
+
+    # Delete the volume
+    print("Deleting volume...")
+    delete_result = await client.invoke(
+        "delete_volume", {"volume_id": new_volume["volume"]["id"]}
+    )
+
+    if "error" in delete_result:
+        print(f"Error deleting volume: {delete_result['error']}")
+    else:
+        print("Volume deleted successfully")
 
 
 def main():
     """Entry point for the example script."""
-    asyncio.run(run_example())
+    # Listings are written in one go, so line buffering only adds flushes
+    sys.stdout.reconfigure(line_buffering=False)
+
+    # Use uvloop's event loop when it is installed
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        runner.run(run_example())
 
 
 if __name__ == "__main__":
@@ -12,12 +12,20 @@ This MCP service provides functions to manage Hetzner Cloud resources:
 - Manage SSH keys for secure server access
 """
 
+import asyncio
+import functools
+import logging
+import operator
 import os
-from typing import Dict, List, Optional, Any
-
-import sys
-import toml
-from hcloud import Client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+import tomllib
+from cachetools import TTLCache
+from hcloud import APIException, Client
+from hcloud.actions.domain import Action
 from hcloud.servers.domain import Server
 from hcloud.firewalls.domain import (
     Firewall,
@@ -27,23 +35,36 @@ from hcloud.firewalls.domain import (
 )
 from hcloud.volumes.domain import Volume
 from hcloud.ssh_keys.domain import SSHKey
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pathlib import Path
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mcp.server.fastmcp import FastMCP
 
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
 def authenticate():
     """
     Authenticate with Hetzner Cloud by retrieving the API token from hcloud CLI configuration.
 
-    This function reads the hcloud CLI configuration file to extract the API token
+    If the HCLOUD_TOKEN environment variable is set it is used directly. Otherwise
+    this function reads the hcloud CLI configuration file to extract the API token
     for the currently active context. The configuration file is expected to be
     located at ~/.config/hcloud/cli.toml in TOML format.
 
+    The result is cached, so the configuration file is only read once.
+
     Returns:
         str: The API token for the active hcloud context.
     """
+    token = os.environ.get("HCLOUD_TOKEN")
+    if token:
+        return token
+
     # Define the path to the hcloud CLI config file
     config_path = Path.home() / ".config" / "hcloud" / "cli.toml"
 
@@ -56,7 +77,8 @@ def authenticate():
 
     try:
         # Parse the TOML configuration file
-        config = toml.load(config_path)
+        with config_path.open("rb") as f:
+            config = tomllib.load(f)
 
         # Get the active context
         active_context = config.get("active_context")
@@ -64,56 +86,273 @@ def authenticate():
             raise ValueError("No active context found in hcloud configuration")
 
         # Find the matching context and retrieve the token
-        contexts = config.get("contexts", [])
-        for context in contexts:
-            if context.get("name") == active_context:
-                token = context.get("token")
-                if not token:
-                    raise ValueError(f"No token found for context '{active_context}'")
-                    sys.exit(1)
-                return token
-
-        # If we reach here, the active context wasn't found
-        raise ValueError(f"Active context '{active_context}' not found in contexts")
-
-    except toml.TomlDecodeError as e:
+        contexts = {
+            context.get("name"): context for context in config.get("contexts", [])
+        }
+        context = contexts.get(active_context)
+        if context is None:
+            raise ValueError(f"Active context '{active_context}' not found in contexts")
+
+        token = context.get("token")
+        if not token:
+            raise ValueError(f"No token found for context '{active_context}'")
+        return token
+
+    except tomllib.TOMLDecodeError as e:
         raise ValueError(f"Invalid TOML format in hcloud configuration: {e}")
     except Exception as e:
         raise RuntimeError(f"Error reading hcloud configuration: {e}")
 
 
+# Maximum number of concurrent connections (and worker threads) for API calls
+HTTP_POOL_SIZE = 64
+
+
+def hcloud_sessions(hcloud_client: Client) -> List[requests.Session]:
+    """
+    Return the requests sessions the hcloud client sends its API requests through.
+
+    hcloud >= 2.6 keeps one session per API endpoint (client._client and
+    client._client_hetzner); older versions keep a single client._requests_session.
+    """
+    sessions = []
+    for name in ("_client", "_client_hetzner"):
+        session = getattr(getattr(hcloud_client, name, None), "_session", None)
+        if isinstance(session, requests.Session):
+            sessions.append(session)
+    if not sessions:
+        session = getattr(hcloud_client, "_requests_session", None)
+        if isinstance(session, requests.Session):
+            sessions.append(session)
+    return sessions
+
+
+def configure_session(hcloud_client: Client) -> int:
+    """
+    Mount a pooled HTTP adapter on the hcloud client's requests sessions.
+
+    Returns the number of connections each session can keep open: HTTP_POOL_SIZE,
+    or requests' default pool size if no session could be configured.
+
+    The sessions live as long as the MCP server process, so keep-alive connections
+    to the Hetzner API are reused across tool invocations instead of paying a new
+    TCP and TLS handshake per call. Only failed connection attempts are retried
+    here; HTTP errors such as 429 and 503 are left to hcloud's own retry loop, so
+    they still surface as APIException.
+    """
+    sessions = hcloud_sessions(hcloud_client)
+    if not sessions:
+        logger.warning(
+            "No requests session found on the hcloud client; "
+            "HTTP connection pooling is not configured"
+        )
+        return DEFAULT_POOLSIZE
+
+    # Each session talks to a single API host, so it gets its own adapter with
+    # one pool of HTTP_POOL_SIZE connections rather than sharing one between hosts
+    for session in sessions:
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, connect=3, read=False, backoff_factor=0.2),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+    return HTTP_POOL_SIZE
+
+
 # Create Hetzner Cloud client
 client = Client(token=authenticate())
+http_pool_size = configure_session(client)
+
+# The hcloud SDK is synchronous, so tools run its calls in worker threads. The
+# pool matches the connection pool that was actually mounted rather than
+# asyncio's CPU-based default, so threads neither queue behind a few workers
+# nor outnumber the pooled connections and churn them.
+api_executor = ThreadPoolExecutor(
+    max_workers=http_pool_size, thread_name_prefix="hcloud"
+)
+
+
+async def run_sync(fn: Callable, *args, **kwargs) -> Any:
+    """Run a blocking hcloud call in the API worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        api_executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+async def no_lookup() -> None:
+    """Stand in for an optional lookup that is skipped in asyncio.gather()."""
+    return None
+
+
+def parse_int(value: Optional[str], default: int) -> int:
+    """Parse a non-negative integer from an environment value, falling back to the default."""
+    return int(value) if value and value.isdigit() else default
+
+
+# Server address, read once at import (defaults to localhost:8080)
+_env = os.environ
+MCP_HOST = _env.get("MCP_HOST", "localhost")
+MCP_PORT = parse_int(_env.get("MCP_PORT"), 8080)
 
 # Create MCP server with server configuration
-mcp = FastMCP(
-    "Hetzner Cloud",
-    host=os.environ.get("MCP_HOST", "localhost"),
-    port=int(os.environ.get("MCP_PORT", 8089)),
-)
+mcp = FastMCP("Hetzner Cloud", host=MCP_HOST, port=MCP_PORT)
+
+# Catalogs (images, server types, locations) change rarely, so their responses
+# and lookups are cached in memory for HCLOUD_CATALOG_TTL seconds
+CATALOG_TTL = parse_int(_env.get("HCLOUD_CATALOG_TTL"), 600)
+catalog_cache = TTLCache(maxsize=64, ttl=CATALOG_TTL)
+
+
+def cache_catalog(fn: Callable) -> Callable:
+    """Cache successful results of an async catalog tool in the catalog cache."""
+
+    @functools.wraps(fn)
+    async def wrapper(**kwargs):
+        key = (fn.__name__, *sorted(kwargs.items()))
+        result = catalog_cache.get(key)
+        if result is None:
+            result = await fn(**kwargs)
+            if "error" not in result:
+                catalog_cache[key] = result
+        return result
+
+    return wrapper
+
+
+async def lookup_catalog(kind: str, name: str, get_by_name: Callable) -> Any:
+    """Look up a catalog object by name, sharing the catalog cache."""
+    key = (kind, name)
+    obj = catalog_cache.get(key)
+    if obj is None:
+        obj = await run_sync(get_by_name, name)
+        if obj is not None:
+            catalog_cache[key] = obj
+    return obj
+
+
+def is_not_found(error: Exception) -> bool:
+    """Return True if an hcloud API error reports that the resource does not exist."""
+    return isinstance(error, APIException) and error.code == "not_found"
+
+
+def tool_errors(message: str, not_found: Optional[str] = None) -> Callable:
+    """
+    Report exceptions raised by an async tool as {"error": ...} results.
+
+    The exception text (or its type name, if it has no text) is prefixed with
+    message, and the failure is logged. If not_found is given, API not_found
+    errors are reported with it instead, formatted with the tool's parameter
+    fields (e.g. "Server with ID {server_id} not found").
+    """
+    prefix = f"{message}: "
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            try:
+                return await fn(**kwargs)
+            except Exception as e:
+                if not_found and is_not_found(e):
+                    return {"error": not_found.format(**dict(kwargs["params"]))}
+                logger.exception("%s failed", fn.__name__)
+                return {"error": prefix + (str(e) or type(e).__name__)}
+
+        return wrapper
+
+    return decorator
+
+
+# Firewalls fetched for a rule or resource change are kept for a few seconds,
+# so consecutive changes to the same firewall share one lookup. Those changes
+# only need the firewall's ID, so its entry is only dropped when the firewall
+# is updated or deleted. Volumes are not cached: their checks read the size and
+# attached server, which every successful volume mutation changes. get_* tools
+# always fetch.
+resource_cache = TTLCache(maxsize=256, ttl=5)
+
+
+async def lookup_resource(kind: str, resource_id: int, get_by_id: Callable) -> Any:
+    """Look up a resource by ID for a mutation, sharing the resource cache."""
+    key = (kind, resource_id)
+    obj = resource_cache.get(key)
+    if obj is None:
+        obj = await run_sync(get_by_id, resource_id)
+        if obj is not None:
+            resource_cache[key] = obj
+    return obj
+
+
+def forget_resource(kind: str, resource_id: int) -> None:
+    """Drop a resource from the resource cache after it was changed."""
+    resource_cache.pop((kind, resource_id), None)
+
+
+def iter_all(resource_client: Any, per_page: int = 50) -> Iterator[Any]:
+    """
+    Yield every resource of an hcloud resource client, one page at a time.
+
+    Unlike get_all(), this does not collect all pages into a list first.
+    Pages are requested lazily as the iterator is consumed.
+    """
+    page = 1
+    while page:
+        result = resource_client.get_list(page=page, per_page=per_page)
+        yield from result[0]
+        meta = result.meta
+        page = meta.pagination.next_page if meta and meta.pagination else None
+
+
+# The helpers below return plain dicts. FastMCP serializes tool results with
+# pydantic_core's native JSON encoder, so no extra encoder needs to be plugged in.
+# Timestamps are converted with isoformat() here so the output format does not
+# depend on how the encoder renders datetimes.
+
+
+def make_dict_serializer(*fields: str) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a converter that copies the given flat attributes of an object to a dict.
+
+    All attributes are read with a single operator.attrgetter call.
+    """
+    getter = operator.attrgetter(*fields)
+
+    def to_dict(obj: Any) -> Dict[str, Any]:
+        return dict(zip(fields, getter(obj)))
+
+    return to_dict
 
 
 # Helper function to convert Server object to dict
 def server_to_dict(server: Server) -> Dict[str, Any]:
     """Convert a Server object to a dictionary with relevant information."""
+    # Read each nested attribute once
+    created = server.created
+    server_type = server.server_type
+    image = server.image
+    datacenter = server.datacenter
+    location = datacenter.location if datacenter else None
+    public_net = server.public_net
+    ipv4 = public_net.ipv4 if public_net else None
+    ipv6 = public_net.ipv6 if public_net else None
+    protection = server.protection
+    volumes = server.volumes
+
     return {
         "id": server.id,
         "name": server.name,
         "status": server.status,
-        "created": server.created.isoformat() if server.created else None,
-        "server_type": server.server_type.name if server.server_type else None,
-        "image": server.image.name if server.image else None,
-        "datacenter": server.datacenter.name if server.datacenter else None,
-        "location": server.datacenter.location.name
-        if server.datacenter and server.datacenter.location
-        else None,
+        "created": created.isoformat() if created else None,
+        "server_type": server_type.name if server_type else None,
+        "image": image.name if image else None,
+        "datacenter": datacenter.name if datacenter else None,
+        "location": location.name if location else None,
         "public_net": {
-            "ipv4": server.public_net.ipv4.ip
-            if server.public_net and server.public_net.ipv4
-            else None,
-            "ipv6": server.public_net.ipv6.ip
-            if server.public_net and server.public_net.ipv6
-            else None,
+            "ipv4": ipv4.ip if ipv4 else None,
+            "ipv6": ipv6.ip if ipv6 else None,
         },
         "included_traffic": server.included_traffic,
         "outgoing_traffic": server.outgoing_traffic,
@@ -122,45 +361,72 @@ def server_to_dict(server: Server) -> Dict[str, Any]:
         "rescue_enabled": server.rescue_enabled,
         "locked": server.locked,
         "protection": {
-            "delete": server.protection["delete"] if server.protection else False,
-            "rebuild": server.protection["rebuild"] if server.protection else False,
+            "delete": protection["delete"] if protection else False,
+            "rebuild": protection["rebuild"] if protection else False,
         },
         "labels": server.labels,
-        "volumes": [volume.id for volume in server.volumes] if server.volumes else [],
+        "volumes": [volume.id for volume in volumes] if volumes else [],
     }
 
 
 # Helper function to convert Volume object to dict
 def volume_to_dict(volume: Volume) -> Dict[str, Any]:
     """Convert a Volume object to a dictionary with relevant information."""
+    # Read each nested attribute once
+    location = volume.location
+    server = volume.server
+    protection = volume.protection
+    created = volume.created
+
     return {
         "id": volume.id,
         "name": volume.name,
         "size": volume.size,
-        "location": volume.location.name if volume.location else None,
-        "server": volume.server.id if volume.server else None,
+        "location": location.name if location else None,
+        "server": server.id if server else None,
         "linux_device": volume.linux_device,
         "protection": {
-            "delete": volume.protection["delete"] if volume.protection else False,
+            "delete": protection["delete"] if protection else False,
         },
         "labels": volume.labels,
         "format": volume.format,
-        "created": volume.created.isoformat() if volume.created else None,
+        "created": created.isoformat() if created else None,
         "status": volume.status,
     }
 
 
+# Flat SSH key attributes, copied in one call
+ssh_key_fields = make_dict_serializer(
+    "id", "name", "fingerprint", "public_key", "labels"
+)
+
+
 # Helper function to convert SSHKey object to dict
 def ssh_key_to_dict(ssh_key: SSHKey) -> Dict[str, Any]:
     """Convert an SSHKey object to a dictionary with relevant information."""
-    return {
-        "id": ssh_key.id,
-        "name": ssh_key.name,
-        "fingerprint": ssh_key.fingerprint,
-        "public_key": ssh_key.public_key,
-        "labels": ssh_key.labels,
-        "created": ssh_key.created.isoformat() if ssh_key.created else None,
-    }
+    result = ssh_key_fields(ssh_key)
+    created = ssh_key.created
+    result["created"] = created.isoformat() if created else None
+    return result
+
+
+# Helper function to convert Location object to dict
+location_to_dict = make_dict_serializer(
+    "id",
+    "name",
+    "description",
+    "country",
+    "city",
+    "latitude",
+    "longitude",
+    "network_zone",
+)
+
+
+# Older hcloud versions don't expose applied_to_resources on firewall resources
+FIREWALL_RESOURCES_HAVE_APPLIED_TO = hasattr(
+    FirewallResource(type="server"), "applied_to_resources"
+)
 
 
 # Helper function to convert Firewall object to dict
@@ -168,8 +434,9 @@ def firewall_to_dict(firewall: Firewall) -> Dict[str, Any]:
     """Convert a Firewall object to a dictionary with relevant information."""
     # Convert rules to dict
     rules = []
-    if firewall.rules:
-        for rule in firewall.rules:
+    firewall_rules = firewall.rules
+    if firewall_rules:
+        for rule in firewall_rules:
             rule_dict = {
                 "direction": rule.direction,
                 "protocol": rule.protocol,
@@ -185,43 +452,87 @@ def firewall_to_dict(firewall: Firewall) -> Dict[str, Any]:
 
     # Convert applied_to resources to dict
     applied_to = []
-    if firewall.applied_to:
-        for resource in firewall.applied_to:
+    firewall_applied_to = firewall.applied_to
+    if firewall_applied_to:
+        for resource in firewall_applied_to:
             resource_dict = {"type": resource.type}
-            if resource.server:
+            server = resource.server
+            if server:
                 resource_dict["server"] = {
-                    "id": resource.server.id,
-                    "name": resource.server.name,
-                }
-            if resource.label_selector:
-                resource_dict["label_selector"] = {
-                    "selector": resource.label_selector.selector
+                    "id": server.id,
+                    "name": server.name,
                 }
-            if getattr(resource, "applied_to_resources", None):
+            label_selector = resource.label_selector
+            if label_selector:
+                resource_dict["label_selector"] = {"selector": label_selector.selector}
+            applied_to_resources = (
+                resource.applied_to_resources
+                if FIREWALL_RESOURCES_HAVE_APPLIED_TO
+                else None
+            )
+            if applied_to_resources:
                 applied_resources = []
-                for applied_resource in resource.applied_to_resources:
+                for applied_resource in applied_to_resources:
                     applied_resource_dict = {"type": applied_resource.type}
-                    if applied_resource.server:
+                    applied_server = applied_resource.server
+                    if applied_server:
                         applied_resource_dict["server"] = {
-                            "id": applied_resource.server.id,
-                            "name": applied_resource.server.name,
+                            "id": applied_server.id,
+                            "name": applied_server.name,
                         }
                     applied_resources.append(applied_resource_dict)
                 resource_dict["applied_to_resources"] = applied_resources
             applied_to.append(resource_dict)
 
+    created = firewall.created
     return {
         "id": firewall.id,
         "name": firewall.name,
         "rules": rules,
         "applied_to": applied_to,
         "labels": firewall.labels,
-        "created": firewall.created.isoformat() if firewall.created else None,
+        "created": created.isoformat() if created else None,
+    }
+
+
+# Action attributes, read in a single call
+ACTION_FIELDS = operator.attrgetter(
+    "id", "status", "command", "progress", "error", "started", "finished"
+)
+
+
+# Helper function to convert Action object to dict
+def action_to_dict(action: Optional[Action]) -> Optional[Dict[str, Any]]:
+    """Convert an Action object to a dictionary, or None if there is no action."""
+    if action is None:
+        return None
+    action_id, status, command, progress, error, started, finished = ACTION_FIELDS(
+        action
+    )
+    return {
+        "id": action_id,
+        "status": status,
+        "command": command,
+        "progress": progress,
+        "error": error,
+        "started": started.isoformat() if started is not None else None,
+        "finished": finished.isoformat() if finished is not None else None,
     }
 
 
+# Helper function to convert a list of Action objects
+def actions_to_list(actions: Optional[List[Action]]) -> Optional[List[Dict[str, Any]]]:
+    """Convert a list of Action objects to dictionaries, or None if there are none."""
+    return [action_to_dict(action) for action in actions] if actions else None
+
+
+# Base model for tool parameters: immutable, and unknown keys are dropped
+class ParamsModel(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
 # Create Server Parameters Model
-class CreateServerParams(BaseModel):
+class CreateServerParams(ParamsModel):
     name: str = Field(..., description="Name of the server")
     server_type: str = Field(..., description="Server type (e.g., cx11, cx21, etc.)")
     image: str = Field(
@@ -234,17 +545,20 @@ class CreateServerParams(BaseModel):
 
 
 # Server ID Parameter Model
-class ServerIdParam(BaseModel):
+# The per-resource ID models (ServerIdParam, FirewallIdParam, VolumeIdParam,
+# SSHKeyIdParam) are kept separate on purpose: their field names (server_id,
+# firewall_id, ...) are part of the published tool schemas and examples.
+class ServerIdParam(ParamsModel):
     server_id: int = Field(..., description="The ID of the server")
 
 
 # Firewall ID Parameter Model
-class FirewallIdParam(BaseModel):
+class FirewallIdParam(ParamsModel):
     firewall_id: int = Field(..., description="The ID of the firewall")
 
 
 # Firewall Rule Parameter Model
-class FirewallRuleParam(BaseModel):
+class FirewallRuleParam(ParamsModel):
     direction: str = Field(..., description="Direction of the rule (in or out)")
     protocol: str = Field(..., description="Protocol (tcp, udp, icmp, esp, or gre)")
     source_ips: List[str] = Field(
@@ -260,7 +574,7 @@ class FirewallRuleParam(BaseModel):
 
 
 # Firewall Resource Parameter Model
-class FirewallResourceParam(BaseModel):
+class FirewallResourceParam(ParamsModel):
     type: str = Field(
         ..., description="Type of resource ('server' or 'label_selector')"
     )
@@ -273,7 +587,7 @@ class FirewallResourceParam(BaseModel):
 
 
 # Create Firewall Parameter Model
-class CreateFirewallParams(BaseModel):
+class CreateFirewallParams(ParamsModel):
     name: str = Field(..., description="Name of the firewall")
     rules: Optional[List[FirewallRuleParam]] = Field(
         None, description="List of firewall rules"
@@ -286,8 +600,15 @@ class CreateFirewallParams(BaseModel):
     )
 
 
+# Create Firewalls Parameter Model
+class CreateFirewallsParams(ParamsModel):
+    firewalls: List[CreateFirewallParams] = Field(
+        ..., description="List of firewalls to create"
+    )
+
+
 # Update Firewall Parameter Model
-class UpdateFirewallParams(BaseModel):
+class UpdateFirewallParams(ParamsModel):
     firewall_id: int = Field(..., description="The ID of the firewall")
     name: Optional[str] = Field(None, description="New name for the firewall")
     labels: Optional[Dict[str, str]] = Field(
@@ -296,13 +617,13 @@ class UpdateFirewallParams(BaseModel):
 
 
 # Set Firewall Rules Parameter Model
-class SetFirewallRulesParams(BaseModel):
+class SetFirewallRulesParams(ParamsModel):
     firewall_id: int = Field(..., description="The ID of the firewall")
     rules: List[FirewallRuleParam] = Field(..., description="List of firewall rules")
 
 
 # Apply/Remove Firewall Resources Parameter Model
-class FirewallResourcesParams(BaseModel):
+class FirewallResourcesParams(ParamsModel):
     firewall_id: int = Field(..., description="The ID of the firewall")
     resources: List[FirewallResourceParam] = Field(
         ..., description="List of resources to apply/remove the firewall to/from"
@@ -310,12 +631,12 @@ class FirewallResourcesParams(BaseModel):
 
 
 # Volume ID Parameter Model
-class VolumeIdParam(BaseModel):
+class VolumeIdParam(ParamsModel):
     volume_id: int = Field(..., description="The ID of the volume")
 
 
 # Create Volume Parameter Model
-class CreateVolumeParams(BaseModel):
+class CreateVolumeParams(ParamsModel):
     name: str = Field(..., description="Name of the volume")
     size: int = Field(..., description="Size of the volume in GB (min 10, max 10240)")
     location: Optional[str] = Field(
@@ -335,8 +656,15 @@ class CreateVolumeParams(BaseModel):
     )
 
 
+# Create Volumes Parameter Model
+class CreateVolumesParams(ParamsModel):
+    volumes: List[CreateVolumeParams] = Field(
+        ..., description="List of volumes to create"
+    )
+
+
 # Attach Volume Parameter Model
-class AttachVolumeParams(BaseModel):
+class AttachVolumeParams(ParamsModel):
     volume_id: int = Field(..., description="The ID of the volume")
     server_id: int = Field(
         ..., description="The ID of the server to attach the volume to"
@@ -347,7 +675,7 @@ class AttachVolumeParams(BaseModel):
 
 
 # Resize Volume Parameter Model
-class ResizeVolumeParams(BaseModel):
+class ResizeVolumeParams(ParamsModel):
     volume_id: int = Field(..., description="The ID of the volume")
     size: int = Field(
         ...,
@@ -356,12 +684,12 @@ class ResizeVolumeParams(BaseModel):
 
 
 # SSH Key ID Parameter Model
-class SSHKeyIdParam(BaseModel):
+class SSHKeyIdParam(ParamsModel):
     ssh_key_id: int = Field(..., description="The ID of the SSH key")
 
 
 # Create SSH Key Parameter Model
-class CreateSSHKeyParams(BaseModel):
+class CreateSSHKeyParams(ParamsModel):
     name: str = Field(..., description="Name of the SSH key")
     public_key: str = Field(..., description="The public key in OpenSSH format")
     labels: Optional[Dict[str, str]] = Field(
@@ -369,8 +697,15 @@ class CreateSSHKeyParams(BaseModel):
     )
 
 
+# Create SSH Keys Parameter Model
+class CreateSSHKeysParams(ParamsModel):
+    ssh_keys: List[CreateSSHKeyParams] = Field(
+        ..., description="List of SSH keys to create"
+    )
+
+
 # Update SSH Key Parameter Model
-class UpdateSSHKeyParams(BaseModel):
+class UpdateSSHKeyParams(ParamsModel):
     ssh_key_id: int = Field(..., description="The ID of the SSH key")
     name: str = Field(..., description="New name for the SSH key")
     labels: Optional[Dict[str, str]] = Field(
@@ -378,11 +713,193 @@ class UpdateSSHKeyParams(BaseModel):
     )
 
 
+# Firewall resource helpers
+
+
+async def resolve_servers(server_ids: Iterable[int]) -> Dict[int, Optional[Server]]:
+    """
+    Fetch the given servers concurrently, returning them keyed by ID.
+
+    Servers that do not exist map to None; any other API error is raised.
+    """
+    unique_ids = list(dict.fromkeys(server_ids))
+    results = await asyncio.gather(
+        *(run_sync(client.servers.get_by_id, server_id) for server_id in unique_ids),
+        return_exceptions=True,
+    )
+    servers = {}
+    for server_id, result in zip(unique_ids, results):
+        if isinstance(result, BaseException):
+            if not is_not_found(result):
+                raise result
+            result = None
+        servers[server_id] = result
+    return servers
+
+
+def build_server_resource(
+    resource_param: FirewallResourceParam, servers: Dict[int, Optional[Server]]
+) -> Tuple[Optional[FirewallResource], Optional[str]]:
+    """Build a firewall resource for a single server from the resolved servers."""
+    server = servers.get(resource_param.server_id)
+    if not server:
+        return None, f"Server with ID {resource_param.server_id} not found"
+    return FirewallResource(type="server", server=server), None
+
+
+@functools.lru_cache(maxsize=1024)
+def label_selector_resource(selector: str) -> FirewallResource:
+    """
+    Return the firewall resource for a label selector.
+
+    The SDK only reads these objects, so one instance is shared per selector.
+    """
+    label_selector = FirewallResourceLabelSelector(selector=selector)
+    return FirewallResource(type="label_selector", label_selector=label_selector)
+
+
+def build_label_selector_resource(
+    resource_param: FirewallResourceParam, servers: Dict[int, Optional[Server]]
+) -> Tuple[Optional[FirewallResource], Optional[str]]:
+    """Build a firewall resource for all servers matching a label selector."""
+    return label_selector_resource(resource_param.label_selector), None
+
+
+# Builder for each supported firewall resource type, with the parameter field it
+# requires and that field's name in error messages
+FIREWALL_RESOURCE_BUILDERS = {
+    "server": (build_server_resource, "server_id", "Server ID"),
+    "label_selector": (
+        build_label_selector_resource,
+        "label_selector",
+        "Label selector",
+    ),
+}
+
+
+async def build_firewall_resources(
+    resource_params: List[FirewallResourceParam],
+    servers: Optional[Dict[int, Optional[Server]]] = None,
+) -> Tuple[Optional[List[FirewallResource]], Optional[str]]:
+    """
+    Convert resource parameters to FirewallResource objects.
+
+    Resource types and their required fields are checked first, so no servers
+    are fetched for invalid input, then the referenced servers that are not in
+    servers are fetched concurrently. Returns (resources, None), or
+    (None, error) on the first problem.
+    """
+    builders = []
+    for resource_param in resource_params:
+        entry = FIREWALL_RESOURCE_BUILDERS.get(resource_param.type)
+        if entry is None:
+            return (
+                None,
+                f"Invalid resource type: {resource_param.type}. Must be 'server' or 'label_selector'",
+            )
+        builder, field, label = entry
+        if not getattr(resource_param, field):
+            return (
+                None,
+                f"{label} is required when resource type is '{resource_param.type}'",
+            )
+        builders.append(builder)
+
+    known = servers or {}
+    fetched = await resolve_servers(
+        resource_param.server_id
+        for resource_param in resource_params
+        if resource_param.type == "server" and resource_param.server_id not in known
+    )
+    servers = {**known, **fetched}
+
+    resources = []
+    for builder, resource_param in zip(builders, resource_params):
+        resource, error = builder(resource_param, servers)
+        if error:
+            return None, error
+        resources.append(resource)
+    return resources, None
+
+
+# Rule parameter fields, in FirewallRule's positional argument order
+FIREWALL_RULE_FIELDS = operator.attrgetter(
+    "direction", "protocol", "source_ips", "port", "destination_ips", "description"
+)
+
+
+def build_firewall_rules(rule_params: List[FirewallRuleParam]) -> List[FirewallRule]:
+    """Convert rule parameters to FirewallRule objects."""
+    return [
+        FirewallRule(*FIREWALL_RULE_FIELDS(rule_param)) for rule_param in rule_params
+    ]
+
+
+async def resolve_firewall_resources(
+    params: FirewallResourcesParams,
+) -> Tuple[Optional[Firewall], Optional[List[FirewallResource]], Optional[str]]:
+    """
+    Fetch a firewall while its resource parameters are converted.
+
+    The two don't depend on each other, so they run concurrently. Returns
+    (firewall, resources, None), or (None, None, error); a missing firewall is
+    reported ahead of any problem with the resources.
+    """
+    firewall, built = await asyncio.gather(
+        lookup_resource("firewall", params.firewall_id, client.firewalls.get_by_id),
+        build_firewall_resources(params.resources),
+        return_exceptions=True,
+    )
+    if firewall is None or is_not_found(firewall):
+        return None, None, f"Firewall with ID {params.firewall_id} not found"
+    for result in (firewall, built):
+        if isinstance(result, BaseException):
+            raise result
+
+    resources, error = built
+    if error:
+        return None, None, error
+    return firewall, resources, None
+
+
+# Batch tools run at most this many creates at once, so one large batch
+# neither takes over the API worker pool nor bursts into the API rate limit
+BATCH_CONCURRENCY = 8
+
+
+async def create_many(create: Callable, items: List[ParamsModel]) -> Dict[str, Any]:
+    """
+    Run a create tool for every item concurrently, BATCH_CONCURRENCY at a time.
+
+    Successful results are collected under "created"; failures are reported under
+    "errors" together with the index of the item that failed.
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def create_one(item: ParamsModel) -> Dict[str, Any]:
+        async with semaphore:
+            return await create(params=item)
+
+    results = await asyncio.gather(*(create_one(item) for item in items))
+    created = []
+    errors = []
+    for index, result in enumerate(results):
+        if "error" in result:
+            errors.append({"index": index, "error": result["error"]})
+        else:
+            created.append(result)
+    return {"created": created, "errors": errors}
+
+
 # MCP Tools
+# @mcp.tool() builds each tool's argument model once, at import. FastMCP has no
+# bulk registration API to share that work, so tools stay registered by
+# decorator next to their definitions.
 
 
 @mcp.tool()
-def list_servers() -> Dict[str, Any]:
+@tool_errors("Failed to list servers")
+async def list_servers() -> Dict[str, Any]:
     """
     List all servers in your Hetzner Cloud account.
 
@@ -391,15 +908,14 @@ def list_servers() -> Dict[str, Any]:
     Example:
     - Basic list: list_servers()
     """
-    try:
-        servers = client.servers.get_all()
-        return {"servers": [server_to_dict(server) for server in servers]}
-    except Exception as e:
-        return {"error": f"Failed to list servers: {str(e)}"}
+    # Pages are fetched and converted in one pass, inside the worker thread
+    servers = iter_all(client.servers)
+    return {"servers": await run_sync(list, map(server_to_dict, servers))}
 
 
 @mcp.tool()
-def get_server(params: ServerIdParam) -> Dict[str, Any]:
+@tool_errors("Failed to get server")
+async def get_server(params: ServerIdParam) -> Dict[str, Any]:
     """
     Get details about a specific server.
 
@@ -408,18 +924,16 @@ def get_server(params: ServerIdParam) -> Dict[str, Any]:
     Example:
     - Get server details: {"server_id": 12345}
     """
-    try:
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
+    server = await run_sync(client.servers.get_by_id, params.server_id)
+    if not server:
+        return {"error": f"Server with ID {params.server_id} not found"}
 
-        return {"server": server_to_dict(server)}
-    except Exception as e:
-        return {"error": f"Failed to get server: {str(e)}"}
+    return {"server": server_to_dict(server)}
 
 
 @mcp.tool()
-def create_server(params: CreateServerParams) -> Dict[str, Any]:
+@tool_errors("Failed to create server")
+async def create_server(params: CreateServerParams) -> Dict[str, Any]:
     """
     Create a new server.
 
@@ -430,90 +944,66 @@ def create_server(params: CreateServerParams) -> Dict[str, Any]:
     - With SSH keys: {"name": "app-server", "server_type": "cx21", "image": "debian-11", "ssh_keys": [123, 456]}
     - Custom location: {"name": "db-server", "server_type": "cx31", "image": "ubuntu-22.04", "location": "fsn1"}
     """
-    try:
-        # Get the objects needed for the API call
-        try:
-            # Debug the objects
-            server_types = client.server_types.get_all()
-            images = client.images.get_all()
-            locations = client.locations.get_all()
-
-            # Print available options for debugging
-            server_type_names = [st.name for st in server_types]
-            image_names = [img.name for img in images]
-            location_names = [loc.name for loc in locations]
-
-            # Try to get objects by name
-            server_type_obj = client.server_types.get_by_name(params.server_type)
-            image_obj = client.images.get_by_name(params.image)
-            location_obj = client.locations.get_by_name(params.location)
-
-            # Check if objects were found
-            if server_type_obj is None:
-                return {
-                    "error": f"Server type '{params.server_type}' not found. Available types: {server_type_names}"
-                }
-            if image_obj is None:
-                return {
-                    "error": f"Image '{params.image}' not found. Available images: {image_names}"
-                }
-            if location_obj is None:
-                return {
-                    "error": f"Location '{params.location}' not found. Available locations: {location_names}"
-                }
-
-            # Handle SSH keys if provided - convert IDs to objects or use names
-            ssh_keys = []
-            if params.ssh_keys:
-                for ssh_key in params.ssh_keys:
-                    # If SSH key is an integer ID, get the object
-                    if isinstance(ssh_key, int):
-                        ssh_key_obj = client.ssh_keys.get_by_id(ssh_key)
-                        if ssh_key_obj:
-                            ssh_keys.append(ssh_key_obj)
-                    # If SSH key is a string name, get the object
-                    elif isinstance(ssh_key, str):
-                        ssh_key_obj = client.ssh_keys.get_by_name(ssh_key)
-                        if ssh_key_obj:
-                            ssh_keys.append(ssh_key_obj)
-
-            # Create server with objects instead of strings
-            response = client.servers.create(
-                name=params.name,
-                server_type=server_type_obj,
-                image=image_obj,
-                location=location_obj,
-                ssh_keys=ssh_keys,
-            )
-        except Exception as e:
-            return {"error": f"Failed to create server: {str(e)}"}
-
-        # Extract server and action information
-        server = response.server
-        action = response.action
+    # Get the objects needed for the API call - the lookups are independent
+    server_type_obj, image_obj, location_obj = await asyncio.gather(
+        lookup_catalog(
+            "server_type", params.server_type, client.server_types.get_by_name
+        ),
+        lookup_catalog("image", params.image, client.images.get_by_name),
+        lookup_catalog("location", params.location, client.locations.get_by_name),
+    )
 
-        # Don't wait for the action to complete - the method doesn't exist
+    # Check if objects were found, listing the alternatives only on failure
+    if server_type_obj is None:
+        server_types = (await list_server_types()).get("server_types", [])
+        server_type_names = [st["name"] for st in server_types]
         return {
-            "server": server_to_dict(server),
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-            "root_password": response.root_password,  # Only provided when no SSH keys are used
+            "error": f"Server type '{params.server_type}' not found. Available types: {server_type_names}"
         }
-    except Exception as e:
-        return {"error": f"Failed to create server: {str(e)}"}
+    if image_obj is None:
+        images = (await list_images()).get("images", [])
+        image_names = [img["name"] for img in images]
+        return {
+            "error": f"Image '{params.image}' not found. Available images: {image_names}"
+        }
+    if location_obj is None:
+        locations = (await list_locations()).get("locations", [])
+        location_names = [loc["name"] for loc in locations]
+        return {
+            "error": f"Location '{params.location}' not found. Available locations: {location_names}"
+        }
+
+    # Handle SSH keys if provided - they are validated as IDs, and the
+    # create call only needs the IDs, so no lookups are required
+    ssh_keys = [SSHKey(id=ssh_key) for ssh_key in (params.ssh_keys or [])]
+
+    # Create server with objects instead of strings
+    response = await run_sync(
+        client.servers.create,
+        name=params.name,
+        server_type=server_type_obj,
+        image=image_obj,
+        location=location_obj,
+        ssh_keys=ssh_keys,
+    )
+
+    # Extract server and action information
+    server = response.server
+    action = response.action
+
+    # Don't wait for the action to complete - the method doesn't exist
+    return {
+        "server": server_to_dict(server),
+        "action": action_to_dict(action),
+        "root_password": response.root_password,  # Only provided when no SSH keys are used
+    }
 
 
 @mcp.tool()
-def delete_server(params: ServerIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to delete server", not_found="Server with ID {server_id} not found"
+)
+async def delete_server(params: ServerIdParam) -> Dict[str, Any]:
     """
     Delete a server.
 
@@ -522,34 +1012,20 @@ def delete_server(params: ServerIdParam) -> Dict[str, Any]:
     Example:
     - Delete server: {"server_id": 12345}
     """
-    try:
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
-
-        action = client.servers.delete(server)
+    # The action only needs the server ID, so skip fetching the server first
+    action = await run_sync(client.servers.delete, Server(id=params.server_id))
 
-        # Don't wait for the action to complete - the method doesn't exist
-        return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to delete server: {str(e)}"}
+    # Don't wait for the action to complete - the method doesn't exist
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 @mcp.tool()
-def list_images() -> Dict[str, Any]:
+@tool_errors("Failed to list images")
+@cache_catalog
+async def list_images() -> Dict[str, Any]:
     """
     List available images.
 
@@ -558,31 +1034,30 @@ def list_images() -> Dict[str, Any]:
     Example:
     - List images: list_images()
     """
-    try:
-        images = client.images.get_all()
-        return {
-            "images": [
-                {
-                    "id": image.id,
-                    "name": image.name,
-                    "description": image.description,
-                    "type": image.type,
-                    "status": image.status,
-                    "os_flavor": image.os_flavor,
-                    "os_version": image.os_version,
-                    "architecture": image.architecture,
-                    "size_gb": image.disk_size,
-                    "created": image.created.isoformat() if image.created else None,
-                }
-                for image in images
-            ]
-        }
-    except Exception as e:
-        return {"error": f"Failed to list images: {str(e)}"}
+    images = await run_sync(client.images.get_all)
+    return {
+        "images": [
+            {
+                "id": image.id,
+                "name": image.name,
+                "description": image.description,
+                "type": image.type,
+                "status": image.status,
+                "os_flavor": image.os_flavor,
+                "os_version": image.os_version,
+                "architecture": image.architecture,
+                "size_gb": image.disk_size,
+                "created": image.created.isoformat() if image.created else None,
+            }
+            for image in images
+        ]
+    }
 
 
 @mcp.tool()
-def list_server_types() -> Dict[str, Any]:
+@tool_errors("Failed to list server types")
+@cache_catalog
+async def list_server_types() -> Dict[str, Any]:
     """
     List available server types.
 
@@ -591,54 +1066,53 @@ def list_server_types() -> Dict[str, Any]:
     Example:
     - List server types: list_server_types()
     """
-    try:
-        server_types = client.server_types.get_all()
-        result = []
-
-        for st in server_types:
-            server_type_info = {
-                "id": st.id,
-                "name": st.name,
-                "description": st.description,
-                "cores": st.cores,
-                "memory_gb": st.memory,
-                "disk_gb": st.disk,
-                "storage_type": st.storage_type,
-                "cpu_type": st.cpu_type,
-                "prices": [],
-            }
+    server_types = await run_sync(client.server_types.get_all)
+    result = []
+
+    for st in server_types:
+        server_type_info = {
+            "id": st.id,
+            "name": st.name,
+            "description": st.description,
+            "cores": st.cores,
+            "memory_gb": st.memory,
+            "disk_gb": st.disk,
+            "storage_type": st.storage_type,
+            "cpu_type": st.cpu_type,
+            "prices": [],
+        }
 
-            if hasattr(st, "prices") and st.prices:
-                price_list = []
-                for price in st.prices:
-                    price_data = {}
-                    if hasattr(price, "price_hourly"):
-                        price_data["price_hourly"] = price.price_hourly
-                    if hasattr(price, "price_monthly"):
-                        price_data["price_monthly"] = price.price_monthly
-                    # Safely add location if available
-                    try:
-                        if (
-                            hasattr(price, "location")
-                            and price.location
-                            and hasattr(price.location, "name")
-                        ):
-                            price_data["location"] = price.location.name
-                    except Exception:
-                        price_data["location"] = None
-
-                    price_list.append(price_data)
-                server_type_info["prices"] = price_list
-
-            result.append(server_type_info)
-
-        return {"server_types": result}
-    except Exception as e:
-        return {"error": f"Failed to list server types: {str(e)}"}
+        if hasattr(st, "prices") and st.prices:
+            price_list = []
+            for price in st.prices:
+                price_data = {}
+                if hasattr(price, "price_hourly"):
+                    price_data["price_hourly"] = price.price_hourly
+                if hasattr(price, "price_monthly"):
+                    price_data["price_monthly"] = price.price_monthly
+                # Safely add location if available
+                try:
+                    if (
+                        hasattr(price, "location")
+                        and price.location
+                        and hasattr(price.location, "name")
+                    ):
+                        price_data["location"] = price.location.name
+                except Exception:
+                    price_data["location"] = None
+
+                price_list.append(price_data)
+            server_type_info["prices"] = price_list
+
+        result.append(server_type_info)
+
+    return {"server_types": result}
 
 
 @mcp.tool()
-def list_locations() -> Dict[str, Any]:
+@tool_errors("Failed to list locations")
+@cache_catalog
+async def list_locations() -> Dict[str, Any]:
     """
     List available locations.
 
@@ -647,29 +1121,15 @@ def list_locations() -> Dict[str, Any]:
     Example:
     - List locations: list_locations()
     """
-    try:
-        locations = client.locations.get_all()
-        return {
-            "locations": [
-                {
-                    "id": location.id,
-                    "name": location.name,
-                    "description": location.description,
-                    "country": location.country,
-                    "city": location.city,
-                    "latitude": location.latitude,
-                    "longitude": location.longitude,
-                    "network_zone": location.network_zone,
-                }
-                for location in locations
-            ]
-        }
-    except Exception as e:
-        return {"error": f"Failed to list locations: {str(e)}"}
+    locations = await run_sync(client.locations.get_all)
+    return {"locations": [location_to_dict(location) for location in locations]}
 
 
 @mcp.tool()
-def power_on(params: ServerIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to power on server", not_found="Server with ID {server_id} not found"
+)
+async def power_on(params: ServerIdParam) -> Dict[str, Any]:
     """
     Power on a server.
 
@@ -678,34 +1138,21 @@ def power_on(params: ServerIdParam) -> Dict[str, Any]:
     Example:
     - Power on server: {"server_id": 12345}
     """
-    try:
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
-
-        action = client.servers.power_on(server)
+    # The action only needs the server ID, so skip fetching the server first
+    action = await run_sync(client.servers.power_on, Server(id=params.server_id))
 
-        # Don't wait for the action to complete - the method doesn't exist
-        return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to power on server: {str(e)}"}
+    # Don't wait for the action to complete - the method doesn't exist
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 @mcp.tool()
-def power_off(params: ServerIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to power off server", not_found="Server with ID {server_id} not found"
+)
+async def power_off(params: ServerIdParam) -> Dict[str, Any]:
     """
     Power off a server.
 
@@ -715,34 +1162,21 @@ def power_off(params: ServerIdParam) -> Dict[str, Any]:
     Example:
     - Power off server: {"server_id": 12345}
     """
-    try:
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
-
-        action = client.servers.power_off(server)
+    # The action only needs the server ID, so skip fetching the server first
+    action = await run_sync(client.servers.power_off, Server(id=params.server_id))
 
-        # Don't wait for the action to complete - the method doesn't exist
-        return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to power off server: {str(e)}"}
+    # Don't wait for the action to complete - the method doesn't exist
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 @mcp.tool()
-def reboot(params: ServerIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to reboot server", not_found="Server with ID {server_id} not found"
+)
+async def reboot(params: ServerIdParam) -> Dict[str, Any]:
     """
     Reboot a server.
 
@@ -751,37 +1185,22 @@ def reboot(params: ServerIdParam) -> Dict[str, Any]:
     Example:
     - Reboot server: {"server_id": 12345}
     """
-    try:
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
+    # The action only needs the server ID, so skip fetching the server first
+    action = await run_sync(client.servers.reboot, Server(id=params.server_id))
 
-        action = client.servers.reboot(server)
-
-        # Don't wait for the action to complete - the method doesn't exist
-        return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to reboot server: {str(e)}"}
+    # Don't wait for the action to complete - the method doesn't exist
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 # Firewall-related MCP tools
 
 
 @mcp.tool()
-def list_firewalls() -> Dict[str, Any]:
+@tool_errors("Failed to list firewalls")
+async def list_firewalls() -> Dict[str, Any]:
     """
     List all firewalls in your Hetzner Cloud account.
 
@@ -790,15 +1209,14 @@ def list_firewalls() -> Dict[str, Any]:
     Example:
     - Basic list: list_firewalls()
     """
-    try:
-        firewalls = client.firewalls.get_all()
-        return {"firewalls": [firewall_to_dict(firewall) for firewall in firewalls]}
-    except Exception as e:
-        return {"error": f"Failed to list firewalls: {str(e)}"}
+    # Pages are fetched and converted in one pass, inside the worker thread
+    firewalls = iter_all(client.firewalls)
+    return {"firewalls": await run_sync(list, map(firewall_to_dict, firewalls))}
 
 
 @mcp.tool()
-def get_firewall(params: FirewallIdParam) -> Dict[str, Any]:
+@tool_errors("Failed to get firewall")
+async def get_firewall(params: FirewallIdParam) -> Dict[str, Any]:
     """
     Get details about a specific firewall.
 
@@ -807,18 +1225,16 @@ def get_firewall(params: FirewallIdParam) -> Dict[str, Any]:
     Example:
     - Get firewall details: {"firewall_id": 12345}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
+    firewall = await run_sync(client.firewalls.get_by_id, params.firewall_id)
+    if not firewall:
+        return {"error": f"Firewall with ID {params.firewall_id} not found"}
 
-        return {"firewall": firewall_to_dict(firewall)}
-    except Exception as e:
-        return {"error": f"Failed to get firewall: {str(e)}"}
+    return {"firewall": await run_sync(firewall_to_dict, firewall)}
 
 
 @mcp.tool()
-def create_firewall(params: CreateFirewallParams) -> Dict[str, Any]:
+@tool_errors("Failed to create firewall")
+async def create_firewall(params: CreateFirewallParams) -> Dict[str, Any]:
     """
     Create a new firewall.
 
@@ -829,90 +1245,76 @@ def create_firewall(params: CreateFirewallParams) -> Dict[str, Any]:
     - With rules: {"name": "web-firewall", "rules": [{"direction": "in", "protocol": "tcp", "port": "80", "source_ips": ["0.0.0.0/0"]}]}
     - With resources: {"name": "web-firewall", "rules": [...], "resources": [{"type": "server", "server_id": 123}]}
     """
+    return await provision_firewall(params=params, servers={})
+
+
+@tool_errors("Failed to create firewall")
+async def provision_firewall(
+    params: CreateFirewallParams, servers: Dict[int, Optional[Server]]
+) -> Dict[str, Any]:
+    """Create a firewall, taking its servers from servers if they were already resolved."""
+    # Prepare rules if provided
+    rules = build_firewall_rules(params.rules) if params.rules else None
+
+    # Prepare resources if provided
+    resources = None
+    if params.resources:
+        resources, error = await build_firewall_resources(params.resources, servers)
+        if error:
+            return {"error": error}
+
+    # Create the firewall
+    response = await run_sync(
+        client.firewalls.create,
+        name=params.name,
+        rules=rules,
+        labels=params.labels,
+        resources=resources,
+    )
+
+    # Extract firewall and action information
+    firewall = response.firewall
+    actions = response.actions
+
+    # Format the response
+    return {
+        "firewall": await run_sync(firewall_to_dict, firewall),
+        "actions": actions_to_list(actions),
+    }
+
+
+@mcp.tool()
+@tool_errors("Failed to create firewalls")
+async def create_firewalls(params: CreateFirewallsParams) -> Dict[str, Any]:
+    """
+    Create several firewalls at once.
+
+    Creates all firewalls concurrently. Each item takes the same fields as create_firewall.
+
+    Example:
+    - Two firewalls: {"firewalls": [{"name": "web-firewall"}, {"name": "db-firewall", "labels": {"role": "db"}}]}
+    """
+    # Resolve each distinct server once, so the concurrent creates share
+    # lookups - failures are left for the individual creates to report
     try:
-        # Prepare rules if provided
-        rules = None
-        if params.rules:
-            rules = []
-            for rule_param in params.rules:
-                rule = FirewallRule(
-                    direction=rule_param.direction,
-                    protocol=rule_param.protocol,
-                    source_ips=rule_param.source_ips,
-                    port=rule_param.port,
-                    destination_ips=rule_param.destination_ips,
-                    description=rule_param.description,
-                )
-                rules.append(rule)
-
-        # Prepare resources if provided
-        resources = None
-        if params.resources:
-            resources = []
-            for resource_param in params.resources:
-                if resource_param.type == "server":
-                    if not resource_param.server_id:
-                        return {
-                            "error": "Server ID is required when resource type is 'server'"
-                        }
-                    server = client.servers.get_by_id(resource_param.server_id)
-                    if not server:
-                        return {
-                            "error": f"Server with ID {resource_param.server_id} not found"
-                        }
-                    resource = FirewallResource(type=resource_param.type, server=server)
-                elif resource_param.type == "label_selector":
-                    if not resource_param.label_selector:
-                        return {
-                            "error": "Label selector is required when resource type is 'label_selector'"
-                        }
-                    label_selector = FirewallResourceLabelSelector(
-                        selector=resource_param.label_selector
-                    )
-                    resource = FirewallResource(
-                        type=resource_param.type, label_selector=label_selector
-                    )
-                else:
-                    return {
-                        "error": f"Invalid resource type: {resource_param.type}. Must be 'server' or 'label_selector'"
-                    }
-                resources.append(resource)
-
-        # Create the firewall
-        response = client.firewalls.create(
-            name=params.name, rules=rules, labels=params.labels, resources=resources
+        servers = await resolve_servers(
+            resource.server_id
+            for firewall in params.firewalls
+            for resource in firewall.resources or ()
+            if resource.type == "server" and resource.server_id
         )
+    except Exception:
+        servers = {}
 
-        # Extract firewall and action information
-        firewall = response.firewall
-        actions = response.actions
-
-        # Format the response
-        return {
-            "firewall": firewall_to_dict(firewall),
-            "actions": [
-                {
-                    "id": action.id,
-                    "status": action.status,
-                    "command": action.command,
-                    "progress": action.progress,
-                    "error": action.error,
-                    "started": action.started.isoformat() if action.started else None,
-                    "finished": action.finished.isoformat()
-                    if action.finished
-                    else None,
-                }
-                for action in actions
-            ]
-            if actions
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to create firewall: {str(e)}"}
+    create = functools.partial(provision_firewall, servers=servers)
+    return await create_many(create, params.firewalls)
 
 
 @mcp.tool()
-def update_firewall(params: UpdateFirewallParams) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to update firewall", not_found="Firewall with ID {firewall_id} not found"
+)
+async def update_firewall(params: UpdateFirewallParams) -> Dict[str, Any]:
     """
     Update a firewall.
 
@@ -922,22 +1324,23 @@ def update_firewall(params: UpdateFirewallParams) -> Dict[str, Any]:
     - Update name: {"firewall_id": 12345, "name": "new-name"}
     - Update labels: {"firewall_id": 12345, "labels": {"key": "value"}}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
+    # The update only needs the firewall ID, so skip fetching the firewall first
+    updated_firewall = await run_sync(
+        client.firewalls.update,
+        firewall=Firewall(id=params.firewall_id),
+        name=params.name,
+        labels=params.labels,
+    )
+    forget_resource("firewall", params.firewall_id)
 
-        updated_firewall = client.firewalls.update(
-            firewall=firewall, name=params.name, labels=params.labels
-        )
-
-        return {"firewall": firewall_to_dict(updated_firewall)}
-    except Exception as e:
-        return {"error": f"Failed to update firewall: {str(e)}"}
+    return {"firewall": await run_sync(firewall_to_dict, updated_firewall)}
 
 
 @mcp.tool()
-def delete_firewall(params: FirewallIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to delete firewall", not_found="Firewall with ID {firewall_id} not found"
+)
+async def delete_firewall(params: FirewallIdParam) -> Dict[str, Any]:
     """
     Delete a firewall.
 
@@ -946,20 +1349,19 @@ def delete_firewall(params: FirewallIdParam) -> Dict[str, Any]:
     Example:
     - Delete firewall: {"firewall_id": 12345}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
+    # The delete only needs the firewall ID, so skip fetching the firewall first
+    success = await run_sync(client.firewalls.delete, Firewall(id=params.firewall_id))
+    forget_resource("firewall", params.firewall_id)
 
-        success = client.firewalls.delete(firewall)
-
-        return {"success": success}
-    except Exception as e:
-        return {"error": f"Failed to delete firewall: {str(e)}"}
+    return {"success": success}
 
 
 @mcp.tool()
-def set_firewall_rules(params: SetFirewallRulesParams) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to set firewall rules",
+    not_found="Firewall with ID {firewall_id} not found",
+)
+async def set_firewall_rules(params: SetFirewallRulesParams) -> Dict[str, Any]:
     """
     Set rules for a firewall.
 
@@ -969,53 +1371,28 @@ def set_firewall_rules(params: SetFirewallRulesParams) -> Dict[str, Any]:
     Example:
     - Set rules: {"firewall_id": 12345, "rules": [{"direction": "in", "protocol": "tcp", "port": "80", "source_ips": ["0.0.0.0/0"]}]}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
-
-        # Convert rule parameters to FirewallRule objects
-        rules = []
-        for rule_param in params.rules:
-            rule = FirewallRule(
-                direction=rule_param.direction,
-                protocol=rule_param.protocol,
-                source_ips=rule_param.source_ips,
-                port=rule_param.port,
-                destination_ips=rule_param.destination_ips,
-                description=rule_param.description,
-            )
-            rules.append(rule)
+    firewall = await lookup_resource(
+        "firewall", params.firewall_id, client.firewalls.get_by_id
+    )
 
-        # Set the rules
-        actions = client.firewalls.set_rules(firewall, rules)
+    # Convert rule parameters to FirewallRule objects
+    rules = build_firewall_rules(params.rules)
 
-        # Format the response
-        return {
-            "success": True,
-            "actions": [
-                {
-                    "id": action.id,
-                    "status": action.status,
-                    "command": action.command,
-                    "progress": action.progress,
-                    "error": action.error,
-                    "started": action.started.isoformat() if action.started else None,
-                    "finished": action.finished.isoformat()
-                    if action.finished
-                    else None,
-                }
-                for action in actions
-            ]
-            if actions
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to set firewall rules: {str(e)}"}
+    # Set the rules
+    actions = await run_sync(client.firewalls.set_rules, firewall, rules)
+
+    # Format the response
+    return {
+        "success": True,
+        "actions": actions_to_list(actions),
+    }
 
 
 @mcp.tool()
-def apply_firewall_to_resources(params: FirewallResourcesParams) -> Dict[str, Any]:
+@tool_errors("Failed to apply firewall to resources")
+async def apply_firewall_to_resources(
+    params: FirewallResourcesParams,
+) -> Dict[str, Any]:
     """
     Apply a firewall to resources.
 
@@ -1025,71 +1402,25 @@ def apply_firewall_to_resources(params: FirewallResourcesParams) -> Dict[str, An
     - Apply to server: {"firewall_id": 12345, "resources": [{"type": "server", "server_id": 123}]}
     - Apply by label: {"firewall_id": 12345, "resources": [{"type": "label_selector", "label_selector": "env=prod"}]}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
-
-        # Convert resource parameters to FirewallResource objects
-        resources = []
-        for resource_param in params.resources:
-            if resource_param.type == "server":
-                if not resource_param.server_id:
-                    return {
-                        "error": "Server ID is required when resource type is 'server'"
-                    }
-                server = client.servers.get_by_id(resource_param.server_id)
-                if not server:
-                    return {
-                        "error": f"Server with ID {resource_param.server_id} not found"
-                    }
-                resource = FirewallResource(type=resource_param.type, server=server)
-            elif resource_param.type == "label_selector":
-                if not resource_param.label_selector:
-                    return {
-                        "error": "Label selector is required when resource type is 'label_selector'"
-                    }
-                label_selector = FirewallResourceLabelSelector(
-                    selector=resource_param.label_selector
-                )
-                resource = FirewallResource(
-                    type=resource_param.type, label_selector=label_selector
-                )
-            else:
-                return {
-                    "error": f"Invalid resource type: {resource_param.type}. Must be 'server' or 'label_selector'"
-                }
-            resources.append(resource)
+    firewall, resources, error = await resolve_firewall_resources(params)
+    if error:
+        return {"error": error}
 
-        # Apply the firewall to the resources
-        actions = client.firewalls.apply_to_resources(firewall, resources)
+    # Apply the firewall to the resources
+    actions = await run_sync(client.firewalls.apply_to_resources, firewall, resources)
 
-        # Format the response
-        return {
-            "success": True,
-            "actions": [
-                {
-                    "id": action.id,
-                    "status": action.status,
-                    "command": action.command,
-                    "progress": action.progress,
-                    "error": action.error,
-                    "started": action.started.isoformat() if action.started else None,
-                    "finished": action.finished.isoformat()
-                    if action.finished
-                    else None,
-                }
-                for action in actions
-            ]
-            if actions
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to apply firewall to resources: {str(e)}"}
+    # Format the response
+    return {
+        "success": True,
+        "actions": actions_to_list(actions),
+    }
 
 
 @mcp.tool()
-def remove_firewall_from_resources(params: FirewallResourcesParams) -> Dict[str, Any]:
+@tool_errors("Failed to remove firewall from resources")
+async def remove_firewall_from_resources(
+    params: FirewallResourcesParams,
+) -> Dict[str, Any]:
     """
     Remove a firewall from resources.
 
@@ -1099,74 +1430,28 @@ def remove_firewall_from_resources(params: FirewallResourcesParams) -> Dict[str,
     - Remove from server: {"firewall_id": 12345, "resources": [{"type": "server", "server_id": 123}]}
     - Remove by label: {"firewall_id": 12345, "resources": [{"type": "label_selector", "label_selector": "env=prod"}]}
     """
-    try:
-        firewall = client.firewalls.get_by_id(params.firewall_id)
-        if not firewall:
-            return {"error": f"Firewall with ID {params.firewall_id} not found"}
-
-        # Convert resource parameters to FirewallResource objects
-        resources = []
-        for resource_param in params.resources:
-            if resource_param.type == "server":
-                if not resource_param.server_id:
-                    return {
-                        "error": "Server ID is required when resource type is 'server'"
-                    }
-                server = client.servers.get_by_id(resource_param.server_id)
-                if not server:
-                    return {
-                        "error": f"Server with ID {resource_param.server_id} not found"
-                    }
-                resource = FirewallResource(type=resource_param.type, server=server)
-            elif resource_param.type == "label_selector":
-                if not resource_param.label_selector:
-                    return {
-                        "error": "Label selector is required when resource type is 'label_selector'"
-                    }
-                label_selector = FirewallResourceLabelSelector(
-                    selector=resource_param.label_selector
-                )
-                resource = FirewallResource(
-                    type=resource_param.type, label_selector=label_selector
-                )
-            else:
-                return {
-                    "error": f"Invalid resource type: {resource_param.type}. Must be 'server' or 'label_selector'"
-                }
-            resources.append(resource)
+    firewall, resources, error = await resolve_firewall_resources(params)
+    if error:
+        return {"error": error}
 
-        # Remove the firewall from the resources
-        actions = client.firewalls.remove_from_resources(firewall, resources)
+    # Remove the firewall from the resources
+    actions = await run_sync(
+        client.firewalls.remove_from_resources, firewall, resources
+    )
 
-        # Format the response
-        return {
-            "success": True,
-            "actions": [
-                {
-                    "id": action.id,
-                    "status": action.status,
-                    "command": action.command,
-                    "progress": action.progress,
-                    "error": action.error,
-                    "started": action.started.isoformat() if action.started else None,
-                    "finished": action.finished.isoformat()
-                    if action.finished
-                    else None,
-                }
-                for action in actions
-            ]
-            if actions
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to remove firewall from resources: {str(e)}"}
+    # Format the response
+    return {
+        "success": True,
+        "actions": actions_to_list(actions),
+    }
 
 
 # Volume-related MCP tools
 
 
 @mcp.tool()
-def list_volumes() -> Dict[str, Any]:
+@tool_errors("Failed to list volumes")
+async def list_volumes() -> Dict[str, Any]:
     """
     List all volumes in your Hetzner Cloud account.
 
@@ -1175,15 +1460,14 @@ def list_volumes() -> Dict[str, Any]:
     Example:
     - Basic list: list_volumes()
     """
-    try:
-        volumes = client.volumes.get_all()
-        return {"volumes": [volume_to_dict(volume) for volume in volumes]}
-    except Exception as e:
-        return {"error": f"Failed to list volumes: {str(e)}"}
+    # Pages are fetched and converted in one pass, inside the worker thread
+    volumes = iter_all(client.volumes)
+    return {"volumes": await run_sync(list, map(volume_to_dict, volumes))}
 
 
 @mcp.tool()
-def get_volume(params: VolumeIdParam) -> Dict[str, Any]:
+@tool_errors("Failed to get volume")
+async def get_volume(params: VolumeIdParam) -> Dict[str, Any]:
     """
     Get details about a specific volume.
 
@@ -1192,18 +1476,16 @@ def get_volume(params: VolumeIdParam) -> Dict[str, Any]:
     Example:
     - Get volume details: {"volume_id": 12345}
     """
-    try:
-        volume = client.volumes.get_by_id(params.volume_id)
-        if not volume:
-            return {"error": f"Volume with ID {params.volume_id} not found"}
+    volume = await run_sync(client.volumes.get_by_id, params.volume_id)
+    if not volume:
+        return {"error": f"Volume with ID {params.volume_id} not found"}
 
-        return {"volume": volume_to_dict(volume)}
-    except Exception as e:
-        return {"error": f"Failed to get volume: {str(e)}"}
+    return {"volume": volume_to_dict(volume)}
 
 
 @mcp.tool()
-def create_volume(params: CreateVolumeParams) -> Dict[str, Any]:
+@tool_errors("Failed to create volume")
+async def create_volume(params: CreateVolumeParams) -> Dict[str, Any]:
     """
     Create a new volume.
 
@@ -1215,76 +1497,89 @@ def create_volume(params: CreateVolumeParams) -> Dict[str, Any]:
     - Attached to server: {"name": "app-volume", "size": 50, "server": 123456, "automount": true}
     - With format: {"name": "log-volume", "size": 20, "format": "ext4"}
     """
-    try:
-        # Get location if provided
-        location = None
-        if params.location:
-            location = client.locations.get_by_name(params.location)
-            if not location:
-                return {"error": f"Location '{params.location}' not found"}
-
-        # Get server if provided
-        server = None
-        if params.server:
-            server = client.servers.get_by_id(params.server)
-            if not server:
-                return {"error": f"Server with ID {params.server} not found"}
-
-        # Create the volume
-        response = client.volumes.create(
-            name=params.name,
-            size=params.size,
-            location=location,
-            server=server,
-            automount=params.automount,
-            format=params.format,
-            labels=params.labels,
-        )
+    return await provision_volume(params=params, servers={})
 
-        # Extract volume and action information
-        volume = response.volume
-        action = response.action
-        next_actions = response.next_actions
 
-        # Format the response
-        return {
-            "volume": volume_to_dict(volume),
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-            "next_actions": [
-                {
-                    "id": next_action.id,
-                    "status": next_action.status,
-                    "command": next_action.command,
-                    "progress": next_action.progress,
-                    "error": next_action.error,
-                    "started": next_action.started.isoformat()
-                    if next_action.started
-                    else None,
-                    "finished": next_action.finished.isoformat()
-                    if next_action.finished
-                    else None,
-                }
-                for next_action in next_actions
-            ]
-            if next_actions
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to create volume: {str(e)}"}
+@tool_errors("Failed to create volume")
+async def provision_volume(
+    params: CreateVolumeParams, servers: Dict[int, Optional[Server]]
+) -> Dict[str, Any]:
+    """Create a volume, taking its server from servers if it was already resolved."""
+    # Get location and server if provided - the lookups are independent
+    server_ids = (
+        [params.server] if params.server and params.server not in servers else []
+    )
+    location, fetched = await asyncio.gather(
+        lookup_catalog("location", params.location, client.locations.get_by_name)
+        if params.location
+        else no_lookup(),
+        resolve_servers(server_ids),
+    )
+    server = {**servers, **fetched}.get(params.server) if params.server else None
+    if params.location and not location:
+        return {"error": f"Location '{params.location}' not found"}
+    if params.server and not server:
+        return {"error": f"Server with ID {params.server} not found"}
+
+    # Create the volume
+    response = await run_sync(
+        client.volumes.create,
+        name=params.name,
+        size=params.size,
+        location=location,
+        server=server,
+        automount=params.automount,
+        format=params.format,
+        labels=params.labels,
+    )
+
+    # Extract volume and action information
+    volume = response.volume
+    action = response.action
+    next_actions = response.next_actions
+
+    # Format the response
+    return {
+        "volume": volume_to_dict(volume),
+        "action": action_to_dict(action),
+        "next_actions": actions_to_list(next_actions),
+    }
 
 
 @mcp.tool()
-def delete_volume(params: VolumeIdParam) -> Dict[str, Any]:
+@tool_errors("Failed to create volumes")
+async def create_volumes(params: CreateVolumesParams) -> Dict[str, Any]:
+    """
+    Create several volumes at once.
+
+    Creates all volumes concurrently. Each item takes the same fields as create_volume.
+
+    Example:
+    - Two volumes: {"volumes": [{"name": "data-1", "size": 10, "location": "nbg1"}, {"name": "data-2", "size": 20, "location": "nbg1"}]}
+    """
+    # Resolve each distinct location and server once, so the concurrent creates
+    # share lookups - failures are left for the individual creates to report
+    locations = {volume.location for volume in params.volumes if volume.location}
+    servers, *_ = await asyncio.gather(
+        resolve_servers(volume.server for volume in params.volumes if volume.server),
+        *(
+            lookup_catalog("location", location, client.locations.get_by_name)
+            for location in locations
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(servers, BaseException):
+        servers = {}
+
+    create = functools.partial(provision_volume, servers=servers)
+    return await create_many(create, params.volumes)
+
+
+@mcp.tool()
+@tool_errors(
+    "Failed to delete volume", not_found="Volume with ID {volume_id} not found"
+)
+async def delete_volume(params: VolumeIdParam) -> Dict[str, Any]:
     """
     Delete a volume.
 
@@ -1293,20 +1588,15 @@ def delete_volume(params: VolumeIdParam) -> Dict[str, Any]:
     Example:
     - Delete volume: {"volume_id": 12345}
     """
-    try:
-        volume = client.volumes.get_by_id(params.volume_id)
-        if not volume:
-            return {"error": f"Volume with ID {params.volume_id} not found"}
-
-        success = client.volumes.delete(volume)
+    # The delete only needs the volume ID, so skip fetching the volume first
+    success = await run_sync(client.volumes.delete, Volume(id=params.volume_id))
 
-        return {"success": success}
-    except Exception as e:
-        return {"error": f"Failed to delete volume: {str(e)}"}
+    return {"success": success}
 
 
 @mcp.tool()
-def attach_volume(params: AttachVolumeParams) -> Dict[str, Any]:
+@tool_errors("Failed to attach volume")
+async def attach_volume(params: AttachVolumeParams) -> Dict[str, Any]:
     """
     Attach a volume to a server.
 
@@ -1316,38 +1606,37 @@ def attach_volume(params: AttachVolumeParams) -> Dict[str, Any]:
     - Attach volume: {"volume_id": 12345, "server_id": 67890}
     - Attach and mount: {"volume_id": 12345, "server_id": 67890, "automount": true}
     """
-    try:
-        volume = client.volumes.get_by_id(params.volume_id)
-        if not volume:
-            return {"error": f"Volume with ID {params.volume_id} not found"}
-
-        server = client.servers.get_by_id(params.server_id)
-        if not server:
-            return {"error": f"Server with ID {params.server_id} not found"}
-
-        action = client.volumes.attach(volume, server, params.automount)
-
-        # Format the response
-        return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
-        }
-    except Exception as e:
-        return {"error": f"Failed to attach volume: {str(e)}"}
+    # The volume and server lookups are independent. Both are awaited before
+    # either result is checked, so a missing volume is reported ahead of a
+    # missing server whichever 404 arrives first.
+    volume, server = await asyncio.gather(
+        run_sync(client.volumes.get_by_id, params.volume_id),
+        run_sync(client.servers.get_by_id, params.server_id),
+        return_exceptions=True,
+    )
+    for result, not_found in (
+        (volume, f"Volume with ID {params.volume_id} not found"),
+        (server, f"Server with ID {params.server_id} not found"),
+    ):
+        if is_not_found(result):
+            return {"error": not_found}
+        if isinstance(result, BaseException):
+            raise result
+
+    action = await run_sync(client.volumes.attach, volume, server, params.automount)
+
+    # Format the response
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 @mcp.tool()
-def detach_volume(params: VolumeIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to detach volume", not_found="Volume with ID {volume_id} not found"
+)
+async def detach_volume(params: VolumeIdParam) -> Dict[str, Any]:
     """
     Detach a volume from a server.
 
@@ -1356,39 +1645,27 @@ def detach_volume(params: VolumeIdParam) -> Dict[str, Any]:
     Example:
     - Detach volume: {"volume_id": 12345}
     """
-    try:
-        volume = client.volumes.get_by_id(params.volume_id)
-        if not volume:
-            return {"error": f"Volume with ID {params.volume_id} not found"}
-
-        if not volume.server:
-            return {
-                "error": f"Volume with ID {params.volume_id} is not attached to any server"
-            }
-
-        action = client.volumes.detach(volume)
-
-        # Format the response
+    # Fetch the volume - its attached server is checked before detaching
+    volume = await run_sync(client.volumes.get_by_id, params.volume_id)
+    if not volume.server:
         return {
-            "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
+            "error": f"Volume with ID {params.volume_id} is not attached to any server"
         }
-    except Exception as e:
-        return {"error": f"Failed to detach volume: {str(e)}"}
+
+    action = await run_sync(client.volumes.detach, volume)
+
+    # Format the response
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 @mcp.tool()
-def resize_volume(params: ResizeVolumeParams) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to resize volume", not_found="Volume with ID {volume_id} not found"
+)
+async def resize_volume(params: ResizeVolumeParams) -> Dict[str, Any]:
     """
     Resize a volume.
 
@@ -1397,42 +1674,37 @@ def resize_volume(params: ResizeVolumeParams) -> Dict[str, Any]:
     Example:
     - Resize volume: {"volume_id": 12345, "size": 100}
     """
-    try:
-        volume = client.volumes.get_by_id(params.volume_id)
-        if not volume:
-            return {"error": f"Volume with ID {params.volume_id} not found"}
-
-        if params.size <= volume.size:
-            return {
-                "error": f"New size ({params.size} GB) must be greater than current size ({volume.size} GB)"
-            }
-
-        action = client.volumes.resize(volume, params.size)
+    # Fetch the volume - its current size is checked before resizing
+    volume = await run_sync(client.volumes.get_by_id, params.volume_id)
 
-        # Format the response
+    # Nothing to do if the volume already has the requested size
+    current_size = volume.size
+    if params.size == current_size:
         return {
             "success": True,
-            "action": {
-                "id": action.id,
-                "status": action.status,
-                "command": action.command,
-                "progress": action.progress,
-                "error": action.error,
-                "started": action.started.isoformat() if action.started else None,
-                "finished": action.finished.isoformat() if action.finished else None,
-            }
-            if action
-            else None,
+            "action": None,
+            "note": f"Volume already has a size of {current_size} GB",
         }
-    except Exception as e:
-        return {"error": f"Failed to resize volume: {str(e)}"}
+    if params.size < current_size:
+        return {
+            "error": f"New size ({params.size} GB) must be greater than current size ({current_size} GB)"
+        }
+
+    action = await run_sync(client.volumes.resize, volume, params.size)
+
+    # Format the response
+    return {
+        "success": True,
+        "action": action_to_dict(action),
+    }
 
 
 # SSH Key-related MCP tools
 
 
 @mcp.tool()
-def list_ssh_keys() -> Dict[str, Any]:
+@tool_errors("Failed to list SSH keys")
+async def list_ssh_keys() -> Dict[str, Any]:
     """
     List all SSH keys in your Hetzner Cloud account.
 
@@ -1441,15 +1713,14 @@ def list_ssh_keys() -> Dict[str, Any]:
     Example:
     - Basic list: list_ssh_keys()
     """
-    try:
-        ssh_keys = client.ssh_keys.get_all()
-        return {"ssh_keys": [ssh_key_to_dict(ssh_key) for ssh_key in ssh_keys]}
-    except Exception as e:
-        return {"error": f"Failed to list SSH keys: {str(e)}"}
+    # Pages are fetched and converted in one pass, inside the worker thread
+    ssh_keys = iter_all(client.ssh_keys)
+    return {"ssh_keys": await run_sync(list, map(ssh_key_to_dict, ssh_keys))}
 
 
 @mcp.tool()
-def get_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
+@tool_errors("Failed to get SSH key")
+async def get_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
     """
     Get details about a specific SSH key.
 
@@ -1458,18 +1729,16 @@ def get_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
     Example:
     - Get SSH key details: {"ssh_key_id": 12345}
     """
-    try:
-        ssh_key = client.ssh_keys.get_by_id(params.ssh_key_id)
-        if not ssh_key:
-            return {"error": f"SSH key with ID {params.ssh_key_id} not found"}
+    ssh_key = await run_sync(client.ssh_keys.get_by_id, params.ssh_key_id)
+    if not ssh_key:
+        return {"error": f"SSH key with ID {params.ssh_key_id} not found"}
 
-        return {"ssh_key": ssh_key_to_dict(ssh_key)}
-    except Exception as e:
-        return {"error": f"Failed to get SSH key: {str(e)}"}
+    return {"ssh_key": ssh_key_to_dict(ssh_key)}
 
 
 @mcp.tool()
-def create_ssh_key(params: CreateSSHKeyParams) -> Dict[str, Any]:
+@tool_errors("Failed to create SSH key")
+async def create_ssh_key(params: CreateSSHKeyParams) -> Dict[str, Any]:
     """
     Create a new SSH key.
 
@@ -1479,18 +1748,35 @@ def create_ssh_key(params: CreateSSHKeyParams) -> Dict[str, Any]:
     - Basic SSH key: {"name": "my-ssh-key", "public_key": "ssh-rsa AAAAB3NzaC1..."}
     - With labels: {"name": "user-key", "public_key": "ssh-rsa AAAAB3NzaC1...", "labels": {"environment": "production"}}
     """
-    try:
-        ssh_key = client.ssh_keys.create(
-            name=params.name, public_key=params.public_key, labels=params.labels
-        )
+    ssh_key = await run_sync(
+        client.ssh_keys.create,
+        name=params.name,
+        public_key=params.public_key,
+        labels=params.labels,
+    )
 
-        return {"ssh_key": ssh_key_to_dict(ssh_key)}
-    except Exception as e:
-        return {"error": f"Failed to create SSH key: {str(e)}"}
+    return {"ssh_key": ssh_key_to_dict(ssh_key)}
+
+
+@mcp.tool()
+@tool_errors("Failed to create SSH keys")
+async def create_ssh_keys(params: CreateSSHKeysParams) -> Dict[str, Any]:
+    """
+    Create several SSH keys at once.
+
+    Creates all SSH keys concurrently. Each item takes the same fields as create_ssh_key.
+
+    Example:
+    - Two SSH keys: {"ssh_keys": [{"name": "alice", "public_key": "ssh-ed25519 AAAAC3Nz..."}, {"name": "bob", "public_key": "ssh-ed25519 AAAAC3Nz..."}]}
+    """
+    return await create_many(create_ssh_key, params.ssh_keys)
 
 
 @mcp.tool()
-def update_ssh_key(params: UpdateSSHKeyParams) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to update SSH key", not_found="SSH key with ID {ssh_key_id} not found"
+)
+async def update_ssh_key(params: UpdateSSHKeyParams) -> Dict[str, Any]:
     """
     Update an SSH key.
 
@@ -1500,22 +1786,22 @@ def update_ssh_key(params: UpdateSSHKeyParams) -> Dict[str, Any]:
     - Update name: {"ssh_key_id": 12345, "name": "new-key-name"}
     - Update labels: {"ssh_key_id": 12345, "name": "existing-name", "labels": {"environment": "staging"}}
     """
-    try:
-        ssh_key = client.ssh_keys.get_by_id(params.ssh_key_id)
-        if not ssh_key:
-            return {"error": f"SSH key with ID {params.ssh_key_id} not found"}
-
-        updated_ssh_key = client.ssh_keys.update(
-            ssh_key=ssh_key, name=params.name, labels=params.labels
-        )
+    # The update only needs the SSH key ID, so skip fetching the key first
+    updated_ssh_key = await run_sync(
+        client.ssh_keys.update,
+        ssh_key=SSHKey(id=params.ssh_key_id),
+        name=params.name,
+        labels=params.labels,
+    )
 
-        return {"ssh_key": ssh_key_to_dict(updated_ssh_key)}
-    except Exception as e:
-        return {"error": f"Failed to update SSH key: {str(e)}"}
+    return {"ssh_key": ssh_key_to_dict(updated_ssh_key)}
 
 
 @mcp.tool()
-def delete_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
+@tool_errors(
+    "Failed to delete SSH key", not_found="SSH key with ID {ssh_key_id} not found"
+)
+async def delete_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
     """
     Delete an SSH key.
 
@@ -1524,16 +1810,19 @@ def delete_ssh_key(params: SSHKeyIdParam) -> Dict[str, Any]:
     Example:
     - Delete SSH key: {"ssh_key_id": 12345}
     """
-    try:
-        ssh_key = client.ssh_keys.get_by_id(params.ssh_key_id)
-        if not ssh_key:
-            return {"error": f"SSH key with ID {params.ssh_key_id} not found"}
+    # The delete only needs the SSH key ID, so skip fetching the key first
+    success = await run_sync(client.ssh_keys.delete, SSHKey(id=params.ssh_key_id))
 
-        success = client.ssh_keys.delete(ssh_key)
+    return {"success": success}
 
-        return {"success": success}
-    except Exception as e:
-        return {"error": f"Failed to delete SSH key: {str(e)}"}
+
+def warm_up_connection() -> None:
+    """Open a pooled connection to the Hetzner API before the first tool call."""
+    try:
+        client.locations.get_all()
+    except Exception:
+        # Best effort only - real tool calls report their own errors
+        pass
 
 
 def start_server(transport="stdio", port=None):
@@ -1543,18 +1832,19 @@ def start_server(transport="stdio", port=None):
         transport: The transport to use (stdio or sse)
         port: Optional port override
     """
-    host = os.environ.get("MCP_HOST", "localhost")
-    if port is None:
-        port = int(os.environ.get("MCP_PORT", 8080))
-    else:
-        port = int(port)
+    host = MCP_HOST
+    port = MCP_PORT if port is None else int(port)
 
-    # Update the server port if it was specified
-    mcp.port = port
+    # Update the server port if it was specified - FastMCP listens on its
+    # settings, not on attributes of the server object
+    mcp.settings.port = port
 
     print(
         f"Starting Hetzner Cloud MCP server on {host}:{port} using {transport} transport"
     )
+    # Pay the TCP/TLS handshake in the background so the first tool call is fast
+    threading.Thread(target=warm_up_connection, daemon=True).start()
+
     # Run the server - this is a synchronous function that will block until the server stops
     mcp.run(transport=transport)
 